@@ -20,58 +20,91 @@ Run:
   python ana_v1.py
   python ana_v1.py --steps 120 --mode step
   python ana_v1.py --mode sleep --delay 0.4
+  python ana_v1.py --mode fast --steps 100000 --render-every 0
 """
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
 import argparse
+import sys
 import time
 
 TILES = ["A", "B", "C", "D", "E", "F"]
 IDX = {t: i for i, t in enumerate(TILES)}
+# The ring is fixed at six tiles, so tile indices are constants on the tick path
+IDX_A, IDX_B, IDX_C, IDX_D, IDX_E, IDX_F = 0, 1, 2, 3, 4, 5
 N = len(TILES)
 
+# Ticks buffered by --mode fast before they are written out in one go
+FAST_FLUSH_TICKS = 512
+
+# Ring neighbors, precomputed so the tick loop avoids a modulo per lookup
+LEFT = tuple((i - 1) % N for i in range(N))
+RIGHT = tuple((i + 1) % N for i in range(N))
+
 def left(i: int) -> int:
-    return (i - 1) % N
+    return LEFT[i]
 
 def right(i: int) -> int:
-    return (i + 1) % N
+    return RIGHT[i]
 
 def domain_sign(i: int) -> int:
     # Fixed segmentation domains for release behavior
-    return +1 if i in (IDX["A"], IDX["B"], IDX["C"]) else -1
+    return +1 if i in (IDX_A, IDX_B, IDX_C) else -1
+
+DOMAIN = tuple(domain_sign(i) for i in range(N))
+
+# Glyph tables: signs indexed by v+1, halos by min(e, 3)
+_S_CHAR = ("-", "0", "+")
+_HALO_CHAR = (" ", "·", "o", "*")
 
 def s_char(v: int) -> str:
-    return {+1: "+", 0: "0", -1: "-"}[v]
+    return _S_CHAR[v + 1]
 
 def halo_char(e: int) -> str:
     # Visual intensity: capped at 6 but displayed as 0,1,2,3+
-    if e <= 0: return " "
-    if e == 1: return "·"
-    if e == 2: return "o"
-    return "*"
+    return _HALO_CHAR[min(e, 3)] if e > 0 else " "
 
 def eff(S: List[int], buf: List[int], i: int) -> int:
     # Effective value for boundary checks: token uses buffered phase sign
     return buf[i] if S[i] == 0 else S[i]
 
+def _boundary_key(s_l: int, s_r: int, b_l: int, b_r: int) -> int:
+    # Pack neighbor states (-1/0/+1) and buffer signs (-1/+1) into a table index
+    return ((s_l + 1) << 4) | ((s_r + 1) << 2) | (((b_l + 1) >> 1) << 1) | ((b_r + 1) >> 1)
+
+# Strict boundary outcome for every (S_left, S_right, buf_left, buf_right)
+_BOUNDARY_LUT = [False] * 64
+for _s_l in (-1, 0, +1):
+    for _s_r in (-1, 0, +1):
+        for _b_l in (-1, +1):
+            for _b_r in (-1, +1):
+                _BOUNDARY_LUT[_boundary_key(_s_l, _s_r, _b_l, _b_r)] = (
+                    (_b_l if _s_l == 0 else _s_l) + (_b_r if _s_r == 0 else _s_r) == 0
+                )
+
 def boundary_strict_effective(S: List[int], buf: List[int], i: int) -> bool:
     # Strict boundary: neighbor effective sum == 0
-    return eff(S, buf, left(i)) + eff(S, buf, right(i)) == 0
+    l, r = LEFT[i], RIGHT[i]
+    return _BOUNDARY_LUT[_boundary_key(S[l], S[r], buf[l], buf[r])]
+
+# Baton travel direction, stored as a bit so reversal is DIR ^= 1
+CW, CCW = 0, 1
+DIR_NAMES = ("CW", "CCW")
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     P: int = 1          # task active
     D: int = 1          # jump flag (1=jump next ARRIVE_C, 0=act next ARRIVE_C)
     TTL: int = 3        # successful ACTs remaining
     FAILCOUNT: int = 0
-    DIR: str = "CW"
+    DIR: int = CW       # CW or CCW
     K: int = 3          # failures to escalate
     H: int = 2          # park duration
     PARK: int = 0       # remaining parked ticks
 
-def step_baton(pos: int, direction: str) -> int:
-    return right(pos) if direction == "CW" else left(pos)
+def step_baton(pos: int, direction: int) -> int:
+    return RIGHT[pos] if direction == CW else LEFT[pos]
 
 def print_legend(Emax: int) -> None:
     print("LEGEND")
@@ -85,38 +118,92 @@ def print_legend(Emax: int) -> None:
     print(" ACT fail: hesitation accumulates at C (cap), reverse DIR; after K fails -> PARK H steps and flip buf(C)")
     print("-" * 72)
 
-def render_circle(S: List[int], E: List[int], buf: List[int], baton_pos: int, direction: str) -> str:
-    # Rough ASCII circle layout
-    layout = {
-        0: (2, 6),   # A
-        1: (0, 10),  # B
-        2: (2, 14),  # C
-        3: (6, 14),  # D
-        4: (8, 10),  # E
-        5: (6, 6),   # F
-    }
-    canvas = [[" "] * 28 for _ in range(13)]
-
-    for i, (r, c) in layout.items():
-        tile = TILES[i]
-        s = s_char(S[i])
-        h = halo_char(E[i])
-        b = s_char(buf[i])
-        mark = f"{tile}:{s}{h}[b{b}]"
-        for j, ch in enumerate(mark):
-            canvas[r][c + j] = ch
-
-    # Baton marker above the current baton holder
-    br, bc = layout[baton_pos]
-    canvas[max(br - 2, 0)][bc + 1] = "B"
-    canvas[max(br - 1, 0)][bc + 1] = "^"
-
-    # Direction label
-    label = f"DIR={direction}"
-    for j, ch in enumerate(label):
-        canvas[11][j] = ch
-
-    return "\n".join("".join(row) for row in canvas)
+# Rough ASCII circle layout: tile index -> (row, col)
+LAYOUT = (
+    (2, 6),   # A
+    (0, 10),  # B
+    (2, 14),  # C
+    (6, 14),  # D
+    (8, 10),  # E
+    (6, 6),   # F
+)
+CANVAS_ROWS, CANVAS_COLS = 13, 28
+_STRIDE = CANVAS_COLS + 1  # row width including the trailing newline
+
+# Byte offsets of the mutable canvas cells; latin-1 keeps every glyph
+# (including '·') at one byte per cell
+_TILE_SLOTS = tuple(r * _STRIDE + c for r, c in LAYOUT)  # "X:sh[bY]"
+_BATON_SLOTS = tuple(
+    (max(r - 2, 0) * _STRIDE + c + 1, max(r - 1, 0) * _STRIDE + c + 1)  # "B", "^"
+    for r, c in LAYOUT
+)
+_DIR_AT = 11 * _STRIDE + len("DIR=")
+_DIR_BYTES = tuple(name.ljust(3).encode("latin-1") for name in DIR_NAMES)
+_S_BYTE = "".join(_S_CHAR).encode("latin-1")
+_HALO_BYTE = "".join(_HALO_CHAR).encode("latin-1")
+
+def _make_template() -> bytearray:
+    # Static canvas: blank rows, tile frames "X:  [b ]" and the "DIR=" prefix
+    canvas = bytearray(b"\n".join([b" " * CANVAS_COLS] * CANVAS_ROWS))
+    for i, at in enumerate(_TILE_SLOTS):
+        frame = f"{TILES[i]}:  [b ]".encode("latin-1")
+        canvas[at:at + len(frame)] = frame
+    canvas[_DIR_AT - 4:_DIR_AT] = b"DIR="
+    return canvas
+
+class Renderer:
+    # Keeps one canvas across ticks: only the sign/halo/buffer cells of tiles
+    # whose (state, halo level, buffer) triple changed, the baton marker and
+    # the direction field are overwritten each render.
+    def __init__(self) -> None:
+        self.canvas = _make_template()
+        self.last_mark: List[Optional[Tuple[int, int, int]]] = [None] * N
+        self.under_baton: List[Tuple[int, int]] = []  # (offset, byte) hidden by the baton marker
+
+    def render(self, S: List[int], E: List[int], buf: List[int], baton_pos: int, direction: int) -> str:
+        canvas = self.canvas
+
+        # Lift the previous baton marker before touching the tiles beneath it
+        for at, ch in reversed(self.under_baton):
+            canvas[at] = ch
+
+        last_mark = self.last_mark
+        for i in range(N):
+            s, h, b = key = (S[i], min(E[i], 3), buf[i])
+            if key == last_mark[i]:
+                continue
+            last_mark[i] = key
+            at = _TILE_SLOTS[i]
+            canvas[at + 2] = _S_BYTE[s + 1]
+            canvas[at + 3] = _HALO_BYTE[h]
+            canvas[at + 6] = _S_BYTE[b + 1]
+
+        # Baton marker above the current baton holder
+        b_at, caret_at = _BATON_SLOTS[baton_pos]
+        under = [(b_at, canvas[b_at])]
+        canvas[b_at] = ord("B")
+        under.append((caret_at, canvas[caret_at]))
+        canvas[caret_at] = ord("^")
+        self.under_baton = under
+
+        # Direction label
+        canvas[_DIR_AT:_DIR_AT + 3] = _DIR_BYTES[direction]
+
+        return canvas.decode("latin-1")
+
+def render_circle(S: List[int], E: List[int], buf: List[int], baton_pos: int, direction: int) -> str:
+    return Renderer().render(S, E, buf, baton_pos, direction)
+
+def write_block(block: str) -> None:
+    # One write per tick: header and canvas go out together
+    sys.stdout.write(f"{block}\n")
+
+def flush_blocks(blocks: List[str]) -> None:
+    # Write buffered tick blocks as write_block would have, then empty the buffer
+    if blocks:
+        sys.stdout.write("\n".join(blocks))
+        sys.stdout.write("\n")
+        blocks.clear()
 
 def simulate(
     steps: int = 80,
@@ -125,24 +212,30 @@ def simulate(
     Hshadow: int = 3,
     Emax: int = 6,
     TTL: int = 3,
+    render_every: int = 1,     # render every K ticks; 0 = final tick only
 ) -> None:
     # Committed states
     S = [+1, +1, +1, -1, -1, -1]
     # Shadow timers (latch + decay)
     E = [0] * N
     # Buffered phase signs
-    buf = [domain_sign(i) for i in range(N)]
+    buf = list(DOMAIN)
 
     # Start baton at A
-    baton_pos = IDX["A"]
+    baton_pos = IDX_A
     S[baton_pos] = 0
 
     task = Task(TTL=TTL)
+    renderer = Renderer()
 
     print_legend(Emax)
-    print(render_circle(S, E, buf, baton_pos, task.DIR))
+    print(renderer.render(S, E, buf, baton_pos, task.DIR))
     print("=" * 72)
 
+    # fast mode batches output instead of paying a print per line
+    out_buf: List[str] = []
+    emit = out_buf.append if mode == "fast" else write_block
+
     for t in range(1, steps + 1):
         # pacing
         if mode == "step":
@@ -150,29 +243,30 @@ def simulate(
         elif mode == "sleep":
             time.sleep(delay)
 
-        # 1) decay shadows
-        for i in range(N):
-            if E[i] > 0:
-                E[i] -= 1
+        # 1) decay shadows (single pass, skipped when nothing is latched)
+        if any(E):
+            E[:] = [e - 1 if e > 0 else 0 for e in E]
+
+        render = (render_every > 0 and t % render_every == 0) or t == steps
 
         # 2) parking
         if task.PARK > 0:
             task.PARK -= 1
-            print(f"\nt={t:02d} (PARK)")
-            print(render_circle(S, E, buf, baton_pos, task.DIR))
+            if render:
+                emit(f"\nt={t:02d} (PARK)\n{renderer.render(S, E, buf, baton_pos, task.DIR)}")
             continue
 
         # 3) move baton (atomic swap)
         old = baton_pos
-        new = step_baton(baton_pos, task.DIR)
+        new = RIGHT[old] if task.DIR == CW else LEFT[old]  # step_baton, inlined
 
-        S[old] = domain_sign(old)  # release
+        S[old] = DOMAIN[old]       # release
         baton_pos = new
         prev = S[baton_pos]
         S[baton_pos] = 0           # acquire
 
         events = []
-        arrive_c = (baton_pos == IDX["C"] and prev in (+1, -1))
+        arrive_c = (baton_pos == IDX_C and prev != 0)
 
         if arrive_c and task.P == 1:
             events.append("ARRIVE_C")
@@ -183,18 +277,20 @@ def simulate(
                 events.append("JUMP")
             else:
                 # ACT attempt
-                L, R = left(baton_pos), right(baton_pos)  # B, D
-                lb = boundary_strict_effective(S, buf, L)
-                rb = boundary_strict_effective(S, buf, R)
+                # Neighbors of C are B and D; theirs are A, C and C, E
+                lb = _BOUNDARY_LUT[((S[IDX_A] + 1) << 4) | ((S[IDX_C] + 1) << 2)
+                                   | (((buf[IDX_A] + 1) >> 1) << 1) | ((buf[IDX_C] + 1) >> 1)]
+                rb = _BOUNDARY_LUT[((S[IDX_C] + 1) << 4) | ((S[IDX_E] + 1) << 2)
+                                   | (((buf[IDX_C] + 1) >> 1) << 1) | ((buf[IDX_E] + 1) >> 1)]
                 events.append(f"b(B)={lb} b(D)={rb}")
 
                 if lb and rb:
                     # ACT success: mirror pulse -> latch neighbor shadows
-                    E[L] = max(E[L], Hshadow)
-                    E[R] = max(E[R], Hshadow)
+                    E[IDX_B] = max(E[IDX_B], Hshadow)
+                    E[IDX_D] = max(E[IDX_D], Hshadow)
 
                     # Reset hesitation at C on success
-                    E[IDX["C"]] = 0
+                    E[IDX_C] = 0
 
                     task.FAILCOUNT = 0
                     task.TTL -= 1
@@ -211,25 +307,30 @@ def simulate(
                         events.append("DONE")
                 else:
                     # Hesitation accumulates at C (cap at Emax), and reversals/escalation
-                    E[IDX["C"]] = min(E[IDX["C"]] + 1, Emax)
-                    events.append(f"HESITATE E(C)={E[IDX['C']]}")
+                    E[IDX_C] = min(E[IDX_C] + 1, Emax)
+                    events.append(f"HESITATE E(C)={E[IDX_C]}")
 
-                    task.DIR = "CCW" if task.DIR == "CW" else "CW"
+                    task.DIR ^= 1
                     task.FAILCOUNT += 1
-                    events.append(f"REV DIR→{task.DIR}")
+                    events.append(f"REV DIR→{DIR_NAMES[task.DIR]}")
                     events.append(f"FAIL→{task.FAILCOUNT}")
 
                     if task.FAILCOUNT >= task.K:
                         task.PARK = task.H
                         task.FAILCOUNT = 0
-                        buf[IDX["C"]] *= -1
-                        events.append(f"ESCALATE PARK={task.H} buf(C)→{s_char(buf[IDX['C']])}")
+                        buf[IDX_C] *= -1
+                        events.append(f"ESCALATE PARK={task.H} buf(C)→{_S_CHAR[buf[IDX_C] + 1]}")
+
+        if render:
+            header = f"\nt={t:02d}"
+            if events:
+                header += " | " + ", ".join(events)
+            emit(f"{header}\n{renderer.render(S, E, buf, baton_pos, task.DIR)}")
+
+        if len(out_buf) >= FAST_FLUSH_TICKS:
+            flush_blocks(out_buf)
 
-        header = f"\nt={t:02d}"
-        if events:
-            header += " | " + ", ".join(events)
-        print(header)
-        print(render_circle(S, E, buf, baton_pos, task.DIR))
+    flush_blocks(out_buf)
 
 def main():
     parser = argparse.ArgumentParser(description="Ana v1 primitive simulation (export-ready).")
@@ -240,6 +341,8 @@ def main():
     parser.add_argument("--hshadow", type=int, default=3, help="Shadow latch level on mirror success.")
     parser.add_argument("--emax", type=int, default=6, help="Hesitation shadow cap (and overall shadow cap).")
     parser.add_argument("--ttl", type=int, default=3, help="Number of successful ACT/MIRROR events to perform.")
+    parser.add_argument("--render-every", type=int, default=1,
+                        help="Render every K ticks (0 = only the final tick).")
     args = parser.parse_args()
 
     simulate(
@@ -249,6 +352,7 @@ def main():
         Hshadow=args.hshadow,
         Emax=args.emax,
         TTL=args.ttl,
+        render_every=args.render_every,
     )
 
 if __name__ == "__main__":